@@ -7,9 +7,9 @@ A faithful recreation of the iconic mobile game
 import pygame
 import sys
 import random
-import time
+from collections import deque
 from enum import Enum
-from typing import List, Tuple
+from typing import Iterable, Optional, Tuple
 
 # Initialize Pygame
 pygame.init()
@@ -21,6 +21,8 @@ GRID_HEIGHT = 20  # 20 cells tall
 SCREEN_WIDTH = GRID_WIDTH * GRID_SIZE
 SCREEN_HEIGHT = GRID_HEIGHT * GRID_SIZE + 60  # Extra space for UI
 FPS = 10
+# Pixel center of grid column/row i
+CENTERS = tuple(i * GRID_SIZE + GRID_SIZE // 2 for i in range(max(GRID_WIDTH, GRID_HEIGHT)))
 
 # Colors (Modified: dark background, red snake)
 BACKGROUND = (20, 20, 40)  # Dark blue-grey
@@ -36,26 +38,82 @@ class Direction(Enum):
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
+# Direction controls (arrows and WASD)
+KEY_TO_DIR = {
+    pygame.K_UP: Direction.UP, pygame.K_w: Direction.UP,
+    pygame.K_DOWN: Direction.DOWN, pygame.K_s: Direction.DOWN,
+    pygame.K_LEFT: Direction.LEFT, pygame.K_a: Direction.LEFT,
+    pygame.K_RIGHT: Direction.RIGHT, pygame.K_d: Direction.RIGHT,
+}
+
+OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
 class SnakeGame:
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Let SDL present through the GPU renderer; fall back to a plain
+        # software window where vsync or scaling is unavailable. SCALED also
+        # enlarges the window by an integer factor to fit the desktop (about
+        # 800x920 on 1080p) and makes display.update(rects) present the whole
+        # frame like flip(), so the dirty rects in draw_dirty() only cut
+        # present cost on the fallback
+        try:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT),
+                                                  pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("SNAKE - Nokia 1100")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
         self.large_font = pygame.font.Font(None, 48)
+
+        # Static playfield (background, border, UI panel, key hints) drawn once
+        self.static_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.static_bg.fill(BACKGROUND)
+        pygame.draw.rect(self.static_bg, BORDER_COLOR,
+                        (0, 0, SCREEN_WIDTH, GRID_HEIGHT * GRID_SIZE), 2)
+        pygame.draw.rect(self.static_bg, (30, 30, 50),
+                        (0, GRID_HEIGHT * GRID_SIZE, SCREEN_WIDTH, 60))
+        self._inst_surf = self.render_text(self.font, "SPACE: Pause | R: Restart | 1-3: Level")
+        self.static_bg.blit(self._inst_surf, (SCREEN_WIDTH - 280, GRID_HEIGHT * GRID_SIZE + 30))
+
+        # Pre-rendered text that never changes
+        self._pause_surf = self.render_text(self.large_font, "PAUSED")
+        self._pause_rect = self._pause_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self._game_over_surf = self.render_text(self.large_font, "GAME OVER", DEATH_COLOR)
+        self._game_over_rect = self._game_over_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
+        self._restart_surf = self.render_text(self.font, "PRESS R TO RESTART")
+        self._restart_rect = self._restart_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90))
+        self._diff_surf = {lvl: self.render_text(self.font, f"LEVEL: {lvl}") for lvl in (1, 2, 3)}
+
+        # (value, surface) pairs, re-rendered only when the value changes
+        self._score_cache = (None, None)
+        self._length_cache = (None, None)
+
+        # Semi-transparent game over overlay, allocated once in display format
+        self.death_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.death_overlay.set_alpha(200)
+        self.death_overlay.fill((0, 0, 0))
         
         # Menu and game state
         self.menu_active = True
         self.selected_level = 1
 
-        # UI buttons (filled in init)
-        self.menu_buttons = {}
+        # Every board cell, used to derive the free cells for spawning
+        self.all_cells = [(x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)]
+
+        # UI buttons and menu text (built once)
+        self._build_menu_rects()
 
         # Apple / orange mechanics (initialize before spawn_food is used)
         self.apples_eaten_since_orange = 0
         self.orange_active = False
         self.orange_pos = None
-        self.orange_spawn_time = 0.0
+        self.orange_spawn_ticks = 0  # pygame ms tick count at spawn
         self.orange_duration = 5.0  # seconds until orange value decays to minimum
 
         self.reset_game()
@@ -63,54 +121,102 @@ class SnakeGame:
         self.game_over_message = None
         self.game_paused = False
     
+    def render_text(self, font: pygame.font.Font, text: str, color=TEXT_COLOR) -> pygame.Surface:
+        """Render antialiased text converted to the display format for fast blits"""
+        return font.render(text, True, color).convert_alpha()
+
     def reset_game(self):
         # Initialize snake in the middle of the screen
         start_x = GRID_WIDTH // 2
         start_y = GRID_HEIGHT // 2
-        self.snake = [(start_x, start_y), (start_x - 1, start_y), (start_x - 2, start_y)]
+        self.snake = deque([(start_x, start_y), (start_x - 1, start_y), (start_x - 2, start_y)])
+        # Board occupancy bitmask: bit y * GRID_WIDTH + x is set iff the snake covers (x, y)
+        self.occ = 0
+        for cell in self.snake:
+            self.occ |= self._bit(*cell)
+        # Cells not covered by the snake, kept in sync with occ. A list plus a
+        # cell -> index map gives O(1) removal (swap with last) and sampling
+        self.free_cells = [cell for cell in self.all_cells if cell not in self.snake]
+        self._free_index = {cell: i for i, cell in enumerate(self.free_cells)}
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT
+        # Step of next_direction, cached to skip the Enum lookup each tick
+        self._dx, self._dy = Direction.RIGHT.value
         self.food = self.spawn_food()
         self.score = 0
         self.game_over = False
         self.game_over_message = None
+        # Cells to repaint on the next frame; a full redraw supersedes them
+        self._dirty_cells = []
+        self._full_redraw = True
+
+    def _bit(self, x: int, y: int) -> int:
+        """Occupancy bit for a grid cell"""
+        return 1 << (y * GRID_WIDTH + x)
     
-    def spawn_food(self) -> Tuple[int, int]:
+    def _swap_to_end(self, cell: Tuple[int, int]):
+        """Move a free cell to the end of free_cells"""
+        free = self.free_cells
+        i = self._free_index[cell]
+        last = free[-1]
+        free[i], free[-1] = last, cell
+        self._free_index[last] = i
+        self._free_index[cell] = len(free) - 1
+
+    def _occupy(self, cell: Tuple[int, int]):
+        """Remove a cell from free_cells"""
+        self._swap_to_end(cell)
+        self.free_cells.pop()
+        del self._free_index[cell]
+
+    def _release(self, cell: Tuple[int, int]):
+        """Return a cell to free_cells"""
+        self._free_index[cell] = len(self.free_cells)
+        self.free_cells.append(cell)
+
+    def _random_free_cell(self, exclude) -> Optional[Tuple[int, int]]:
+        """Pick a random free cell other than exclude in a single draw, or None if there is none"""
+        n = len(self.free_cells)
+        if exclude in self._free_index:
+            # Park the excluded cell at the end and sample before it
+            self._swap_to_end(exclude)
+            n -= 1
+        if n == 0:
+            return None
+        return self.free_cells[random.randrange(n)]
+
+    def spawn_food(self) -> Optional[Tuple[int, int]]:
         """Spawn food at a random location not occupied by snake"""
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            if (x, y) not in self.snake and (not self.orange_active or (x, y) != self.orange_pos):
-                return (x, y)
+        return self._random_free_cell(self.orange_pos)
 
-    def spawn_orange(self) -> Tuple[int, int]:
+    def spawn_orange(self) -> Optional[Tuple[int, int]]:
         """Spawn orange at a random location not occupied by snake or food"""
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            if (x, y) not in self.snake and (x, y) != self.food:
-                return (x, y)
+        return self._random_free_cell(self.food)
     
     def handle_input(self) -> bool:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
+            # The window contents may have been lost; repaint even when frozen
+            if event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+                self._full_redraw = True
             # Menu handling with mouse and keys
             if self.menu_active:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     mx, my = event.pos
+                    hit = next((key for key, rect in self.menu_buttons.items()
+                                if rect.collidepoint(mx, my)), None)
                     # Play button
-                    if self.menu_buttons.get('play') and self.menu_buttons['play'].collidepoint(mx, my):
+                    if hit == 'play':
                         self.menu_active = False
                         self.reset_game()
                     # Quit
-                    if self.menu_buttons.get('quit') and self.menu_buttons['quit'].collidepoint(mx, my):
+                    elif hit == 'quit':
                         return False
                     # Level buttons
-                    for key in ('lvl1', 'lvl2', 'lvl3'):
-                        if self.menu_buttons.get(key) and self.menu_buttons[key].collidepoint(mx, my):
-                            self.selected_level = int(key[-1])
-                            self.difficulty = self.selected_level
+                    elif hit in ('lvl1', 'lvl2', 'lvl3'):
+                        self.selected_level = int(hit[-1])
+                        self.difficulty = self.selected_level
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_RETURN:
                         self.menu_active = False
@@ -122,22 +228,17 @@ class SnakeGame:
 
             if event.type == pygame.KEYDOWN:
                 # Direction controls
-                if event.key in (pygame.K_UP, pygame.K_w):
-                    if self.direction != Direction.DOWN:
-                        self.next_direction = Direction.UP
-                elif event.key in (pygame.K_DOWN, pygame.K_s):
-                    if self.direction != Direction.UP:
-                        self.next_direction = Direction.DOWN
-                elif event.key in (pygame.K_LEFT, pygame.K_a):
-                    if self.direction != Direction.RIGHT:
-                        self.next_direction = Direction.LEFT
-                elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                    if self.direction != Direction.LEFT:
-                        self.next_direction = Direction.RIGHT
+                d = KEY_TO_DIR.get(event.key)
+                if d is not None:
+                    if OPPOSITE[d] != self.direction:
+                        self.next_direction = d
+                        self._dx, self._dy = d.value
+                    continue
                 
                 # Game controls
-                elif event.key == pygame.K_SPACE:
+                if event.key == pygame.K_SPACE:
                     self.game_paused = not self.game_paused
+                    self._full_redraw = True
                 elif event.key == pygame.K_r:
                     self.reset_game()
                     self.game_paused = False
@@ -162,152 +263,232 @@ class SnakeGame:
         
         self.direction = self.next_direction
         
+        snake = self.snake
+        
         # Calculate new head position
-        head_x, head_y = self.snake[0]
-        dx, dy = self.direction.value
-        new_head = (head_x + dx, head_y + dy)
+        head_x, head_y = snake[0]
+        x = head_x + self._dx
+        y = head_y + self._dy
+        new_head = (x, y)
         
         # Check wall collision
-        if (new_head[0] < 0 or new_head[0] >= GRID_WIDTH or
-            new_head[1] < 0 or new_head[1] >= GRID_HEIGHT):
+        if not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT):
             self.game_over = True
             self.game_over_message = "WALL COLLISION"
+            self._full_redraw = True
             return
         
         # Check self collision
-        if new_head in self.snake:
+        b = 1 << (y * GRID_WIDTH + x)  # self._bit(x, y), inlined
+        if self.occ & b:
             self.game_over = True
             self.game_over_message = "SELF COLLISION"
+            self._full_redraw = True
             return
         
-        # Add new head
-        self.snake.insert(0, new_head)
+        # Add new head; the old head is repainted to drop its eyes
+        self._dirty_cells += (new_head, snake[0])
+        snake.appendleft(new_head)
+        self.occ |= b
+        self._occupy(new_head)
         
         # Check food collision
         if new_head == self.food:
             self.score += 10 * self.difficulty
             self.food = self.spawn_food()
+            if self.food is None:
+                # No free cell left for food: the snake has filled the board
+                self.game_over = True
+                self.game_over_message = "BOARD FULL - YOU WIN"
+                self._full_redraw = True
+                return
+            self._dirty_cells.append(self.food)
             # Track apples eaten; spawn orange after 5 apples
             self.apples_eaten_since_orange += 1
             if self.apples_eaten_since_orange >= 5 and not self.orange_active:
-                self.orange_pos = self.spawn_orange()
-                self.orange_active = True
-                self.orange_spawn_time = time.time()
-                self.apples_eaten_since_orange = 0
+                orange_pos = self.spawn_orange()
+                # Skip the orange when the food took the last free cell
+                if orange_pos is not None:
+                    self.orange_pos = orange_pos
+                    self.orange_active = True
+                    self._full_redraw = True
+                    self.orange_spawn_ticks = pygame.time.get_ticks()
+                    self.apples_eaten_since_orange = 0
         else:
             # Remove tail if no food eaten
-            self.snake.pop()
+            tail = snake.pop()
+            # Orange growth duplicates the tail cell; only free it once the last copy leaves
+            if snake[-1] != tail:
+                tail_x, tail_y = tail
+                self.occ &= ~(1 << (tail_y * GRID_WIDTH + tail_x))  # self._bit(*tail), inlined
+                self._release(tail)
+            # Repaint the old and new tail cells
+            self._dirty_cells += (tail, snake[-1])
 
         # Check orange collision
         if self.orange_active and new_head == self.orange_pos:
             # Compute orange score based on time since spawn (decays linearly from 50 to 5)
-            elapsed = time.time() - self.orange_spawn_time
+            elapsed = (pygame.time.get_ticks() - self.orange_spawn_ticks) / 1000.0
             frac = min(max(elapsed / self.orange_duration, 0.0), 1.0)
             orange_score = max(5, int(50 - frac * 45))
             self.score += orange_score
-            # Give a small length bonus
-            for _ in range(2):
-                self.snake.append(self.snake[-1])
+            # Give a small length bonus; the tail cell is already marked in occ
+            end = snake[-1]
+            snake.extend((end, end))
             self.orange_active = False
             self.orange_pos = None
-            self.orange_spawn_time = 0.0
+            self.orange_spawn_ticks = 0
+            self._full_redraw = True
     
-    def draw(self):
-        self.screen.fill(BACKGROUND)
-        # If menu active, draw menu and return
-        if self.menu_active:
-            self.draw_menu()
-            pygame.display.flip()
-            return
-        
-        # Draw border
-        pygame.draw.rect(self.screen, BORDER_COLOR, 
-                        (0, 0, SCREEN_WIDTH, GRID_HEIGHT * GRID_SIZE), 2)
-        
+    def tile_rect(self, cell: Tuple[int, int]) -> pygame.Rect:
+        """Screen rectangle covered by a grid cell"""
+        return pygame.Rect(cell[0] * GRID_SIZE, cell[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+
+    def draw_items(self):
         # Draw food
         # Draw apple as circle
-        ax = self.food[0] * GRID_SIZE + GRID_SIZE // 2
-        ay = self.food[1] * GRID_SIZE + GRID_SIZE // 2
-        pygame.draw.circle(self.screen, FOOD_COLOR, (ax, ay), GRID_SIZE // 2 - 4)
+        if self.food:
+            ax = CENTERS[self.food[0]]
+            ay = CENTERS[self.food[1]]
+            pygame.draw.circle(self.screen, FOOD_COLOR, (ax, ay), GRID_SIZE // 2 - 4)
 
         # Draw orange if active (bigger circle)
         if self.orange_active and self.orange_pos:
-            ox = self.orange_pos[0] * GRID_SIZE + GRID_SIZE // 2
-            oy = self.orange_pos[1] * GRID_SIZE + GRID_SIZE // 2
+            ox = CENTERS[self.orange_pos[0]]
+            oy = CENTERS[self.orange_pos[1]]
             pygame.draw.circle(self.screen, (255, 140, 0), (ox, oy), GRID_SIZE // 2)
             pygame.draw.circle(self.screen, (200, 100, 0), (ox, oy), GRID_SIZE // 2, 2)
-        
-        # Draw snake as rounded body (circles + midpoint circles to hide grid)
-        for i, (x, y) in enumerate(self.snake):
-            cx = x * GRID_SIZE + GRID_SIZE // 2
-            cy = y * GRID_SIZE + GRID_SIZE // 2
-            # Head color slightly different
-            color = (255, 100, 100) if i == 0 else SNAKE_COLOR
-            # Draw circle for segment
-            pygame.draw.circle(self.screen, color, (cx, cy), GRID_SIZE // 2 - 1)
-
-            # Draw midpoint circle between this and next segment to fully cover grid lines
-            if i + 1 < len(self.snake):
-                nx, ny = self.snake[i + 1]
-                ncx = nx * GRID_SIZE + GRID_SIZE // 2
-                ncy = ny * GRID_SIZE + GRID_SIZE // 2
-                midx = (cx + ncx) // 2
-                midy = (cy + ncy) // 2
-                pygame.draw.circle(self.screen, color, (midx, midy), GRID_SIZE // 2 - 1)
-
-            # Draw eyes on head
-            if i == 0:
-                eye_color = (0, 0, 0)
-                ex_offset = GRID_SIZE // 4
-                ey_offset = GRID_SIZE // 6
-                if self.direction == Direction.RIGHT:
-                    pygame.draw.circle(self.screen, eye_color, (cx + ex_offset, cy - ey_offset), 2)
-                    pygame.draw.circle(self.screen, eye_color, (cx + ex_offset, cy + ey_offset), 2)
-                elif self.direction == Direction.LEFT:
-                    pygame.draw.circle(self.screen, eye_color, (cx - ex_offset, cy - ey_offset), 2)
-                    pygame.draw.circle(self.screen, eye_color, (cx - ex_offset, cy + ey_offset), 2)
-                elif self.direction == Direction.UP:
-                    pygame.draw.circle(self.screen, eye_color, (cx - ey_offset, cy - ex_offset), 2)
-                    pygame.draw.circle(self.screen, eye_color, (cx + ey_offset, cy - ex_offset), 2)
-                elif self.direction == Direction.DOWN:
-                    pygame.draw.circle(self.screen, eye_color, (cx - ey_offset, cy + ex_offset), 2)
-                    pygame.draw.circle(self.screen, eye_color, (cx + ey_offset, cy + ex_offset), 2)
-        
-        # Draw UI background
-        pygame.draw.rect(self.screen, (30, 30, 50), 
-                        (0, GRID_HEIGHT * GRID_SIZE, SCREEN_WIDTH, 60))
-        
+
+    def draw_body(self, cells: Iterable[Tuple[int, int]], cap: bool = True):
+        """Draw a run of snake cells as one thick polyline, rounding the tail end if cap"""
+        # Hoist globals and attributes into locals for the per-segment loops
+        draw_circle = pygame.draw.circle
+        screen = self.screen
+        color = SNAKE_COLOR
+        centers = CENTERS
+        gs = GRID_SIZE
+        radius = gs // 2 - 1
+
+        points = [(centers[x], centers[y]) for x, y in cells]
+        if len(points) > 1:
+            pygame.draw.lines(screen, color, False, points, gs - 2)
+        # Thick line joints are square, so round off the bends
+        for prev, cur, nxt in zip(points, points[1:], points[2:]):
+            if prev[0] != nxt[0] and prev[1] != nxt[1]:
+                draw_circle(screen, color, cur, radius)
+        if cap:
+            draw_circle(screen, color, points[-1], radius)
+
+    def draw_head(self):
+        x, y = self.snake[0]
+        cx = CENTERS[x]
+        cy = CENTERS[y]
+        # Head color slightly different
+        pygame.draw.circle(self.screen, (255, 100, 100), (cx, cy), GRID_SIZE // 2 - 1)
+
+        # Draw eyes on head
+        eye_color = (0, 0, 0)
+        ex_offset = GRID_SIZE // 4
+        ey_offset = GRID_SIZE // 6
+        if self.direction == Direction.RIGHT:
+            pygame.draw.circle(self.screen, eye_color, (cx + ex_offset, cy - ey_offset), 2)
+            pygame.draw.circle(self.screen, eye_color, (cx + ex_offset, cy + ey_offset), 2)
+        elif self.direction == Direction.LEFT:
+            pygame.draw.circle(self.screen, eye_color, (cx - ex_offset, cy - ey_offset), 2)
+            pygame.draw.circle(self.screen, eye_color, (cx - ex_offset, cy + ey_offset), 2)
+        elif self.direction == Direction.UP:
+            pygame.draw.circle(self.screen, eye_color, (cx - ey_offset, cy - ex_offset), 2)
+            pygame.draw.circle(self.screen, eye_color, (cx + ey_offset, cy - ex_offset), 2)
+        elif self.direction == Direction.DOWN:
+            pygame.draw.circle(self.screen, eye_color, (cx - ey_offset, cy + ex_offset), 2)
+            pygame.draw.circle(self.screen, eye_color, (cx + ey_offset, cy + ex_offset), 2)
+
+    def draw_hud(self) -> pygame.Rect:
+        """Redraw the UI panel below the board and return its rectangle"""
+        panel = pygame.Rect(0, GRID_HEIGHT * GRID_SIZE, SCREEN_WIDTH, 60)
+        self.screen.blit(self.static_bg, panel, panel)
+
         # Draw score
-        score_text = self.font.render(f"SCORE: {self.score}", True, TEXT_COLOR)
-        self.screen.blit(score_text, (10, GRID_HEIGHT * GRID_SIZE + 5))
+        if self._score_cache[0] != self.score:
+            self._score_cache = (self.score, self.render_text(self.font, f"SCORE: {self.score}"))
+        self.screen.blit(self._score_cache[1], (10, GRID_HEIGHT * GRID_SIZE + 5))
         
         # Draw difficulty
-        diff_text = self.font.render(f"LEVEL: {self.difficulty}", True, TEXT_COLOR)
-        self.screen.blit(diff_text, (SCREEN_WIDTH - 150, GRID_HEIGHT * GRID_SIZE + 5))
+        self.screen.blit(self._diff_surf[self.difficulty], (SCREEN_WIDTH - 150, GRID_HEIGHT * GRID_SIZE + 5))
         
         # Draw snake length
-        length_text = self.font.render(f"LENGTH: {len(self.snake)}", True, TEXT_COLOR)
-        self.screen.blit(length_text, (10, GRID_HEIGHT * GRID_SIZE + 30))
+        length = len(self.snake)
+        if self._length_cache[0] != length:
+            self._length_cache = (length, self.render_text(self.font, f"LENGTH: {length}"))
+        self.screen.blit(self._length_cache[1], (10, GRID_HEIGHT * GRID_SIZE + 30))
+        return panel
+
+    def draw_dirty(self):
+        """Repaint only the cells touched since the last frame"""
+        dirty = []
+        snake = self.snake
+        n = len(snake)
+        # Only the ends of the body can reach a changed cell
+        head_end = [snake[i] for i in range(min(n, 3))]
+        tail_end = [snake[i] for i in range(max(n - 3, 0), n)]
+        screen = self.screen
+        static_bg = self.static_bg
+        for cell in self._dirty_cells:
+            rect = self.tile_rect(cell)
+            screen.set_clip(rect)
+            screen.blit(static_bg, rect, rect)
+            self.draw_items()
+            self.draw_body(head_end, cap=False)
+            self.draw_body(tail_end)
+            self.draw_head()
+            dirty.append(rect)
+        screen.set_clip(None)
+        self._dirty_cells.clear()
+
+        if self._length_cache[0] != n or self._score_cache[0] != self.score:
+            dirty.append(self.draw_hud())
+        # Partial present on a software window; a full present under SCALED
+        pygame.display.update(dirty)
+
+    def draw(self):
+        # If menu active, draw menu and return
+        if self.menu_active:
+            self.draw_menu()
+            pygame.display.flip()
+            self._full_redraw = True
+            return
+
+        if not self._full_redraw:
+            self.draw_dirty()
+            return
+        self._full_redraw = False
+        self._dirty_cells.clear()
+        
+        # Background, border, UI panel and key hints
+        self.screen.blit(self.static_bg, (0, 0))
+        
+        self.draw_items()
+        
+        # Draw snake as a thick polyline with the head on top
+        self.draw_body(self.snake)
+        self.draw_head()
+        
+        self.draw_hud()
         
         # Draw pause status
         if self.game_paused:
-            pause_text = self.large_font.render("PAUSED", True, TEXT_COLOR)
-            pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            pygame.draw.rect(self.screen, BACKGROUND, pause_rect.inflate(20, 20))
-            self.screen.blit(pause_text, pause_rect)
+            pygame.draw.rect(self.screen, BACKGROUND, self._pause_rect.inflate(20, 20))
+            self.screen.blit(self._pause_surf, self._pause_rect)
         
         # Draw game over screen
         if self.game_over:
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill((0, 0, 0))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self.death_overlay, (0, 0))
+            # Keep the key hints readable on top of the overlay
+            self.screen.blit(self._inst_surf, (SCREEN_WIDTH - 280, GRID_HEIGHT * GRID_SIZE + 30))
             
             # Game over text
-            game_over_text = self.large_font.render("GAME OVER", True, DEATH_COLOR)
-            game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
-            self.screen.blit(game_over_text, game_over_rect)
+            self.screen.blit(self._game_over_surf, self._game_over_rect)
             
             # Reason
             reason_text = self.font.render(self.game_over_message, True, TEXT_COLOR)
@@ -320,73 +501,62 @@ class SnakeGame:
             self.screen.blit(final_score_text, final_score_rect)
             
             # Instructions
-            restart_text = self.font.render("PRESS R TO RESTART", True, TEXT_COLOR)
-            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90))
-            self.screen.blit(restart_text, restart_rect)
-        
-        # Draw instructions on bottom right
-        inst_text = self.font.render("SPACE: Pause | R: Restart | 1-3: Level", True, TEXT_COLOR)
-        self.screen.blit(inst_text, (SCREEN_WIDTH - 280, GRID_HEIGHT * GRID_SIZE + 30))
+            self.screen.blit(self._restart_surf, self._restart_rect)
         
         pygame.display.flip()
 
-    def draw_menu(self):
-        # Background for menu (slightly different shade)
-        self.screen.fill((30, 30, 60))
-
-        # Title
-        title = self.large_font.render("SNAKE", True, (180, 255, 180))
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
-        self.screen.blit(title, title_rect)
-
-        # Subtitle / instructions
-        subtitle = self.font.render("Classic Nokia-style snake – select options below", True, TEXT_COLOR)
-        sub_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 120))
-        self.screen.blit(subtitle, sub_rect)
-
+    def _build_menu_rects(self):
+        """Lay out the menu buttons and pre-render all menu text"""
         # Buttons
         btn_w, btn_h = 220, 48
         cx = SCREEN_WIDTH // 2
         start_y = 180
 
-        play_rect = pygame.Rect(cx - btn_w // 2, start_y, btn_w, btn_h)
-        lvl1_rect = pygame.Rect(cx - btn_w // 2, start_y + 70, 70, 40)
-        lvl2_rect = pygame.Rect(cx - 35, start_y + 70, 70, 40)
-        lvl3_rect = pygame.Rect(cx + btn_w // 2 - 70, start_y + 70, 70, 40)
-        quit_rect = pygame.Rect(cx - btn_w // 2, start_y + 140, btn_w, btn_h)
-
-        # Store for input handling
-        self.menu_buttons['play'] = play_rect
-        self.menu_buttons['lvl1'] = lvl1_rect
-        self.menu_buttons['lvl2'] = lvl2_rect
-        self.menu_buttons['lvl3'] = lvl3_rect
-        self.menu_buttons['quit'] = quit_rect
-
-        # Draw main Play button
-        pygame.draw.rect(self.screen, BORDER_COLOR, play_rect)
-        play_text = self.font.render("PLAY", True, TEXT_COLOR)
-        play_text_rect = play_text.get_rect(center=play_rect.center)
-        self.screen.blit(play_text, play_text_rect)
+        # Stored for drawing and input handling
+        self.menu_buttons = {
+            'play': pygame.Rect(cx - btn_w // 2, start_y, btn_w, btn_h),
+            'lvl1': pygame.Rect(cx - btn_w // 2, start_y + 70, 70, 40),
+            'lvl2': pygame.Rect(cx - 35, start_y + 70, 70, 40),
+            'lvl3': pygame.Rect(cx + btn_w // 2 - 70, start_y + 70, 70, 40),
+            'quit': pygame.Rect(cx - btn_w // 2, start_y + 140, btn_w, btn_h),
+        }
+
+        # Button labels, centered on their buttons
+        self._menu_labels = {}
+        for key, text in (('play', "PLAY"), ('lvl1', "1"), ('lvl2', "2"), ('lvl3', "3"), ('quit', "QUIT")):
+            surf = self.render_text(self.font, text)
+            self._menu_labels[key] = (surf, surf.get_rect(center=self.menu_buttons[key].center))
+
+        # Title, subtitle / instructions and hint
+        title = self.render_text(self.large_font, "SNAKE", (180, 255, 180))
+        subtitle = self.render_text(self.font, "Classic Nokia-style snake – select options below")
+        hint = self.render_text(self.font, "Press ENTER to start | 1-3 to choose level")
+        self._menu_text = [
+            (title, title.get_rect(center=(SCREEN_WIDTH // 2, 80))),
+            (subtitle, subtitle.get_rect(center=(SCREEN_WIDTH // 2, 120))),
+            (hint, hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))),
+        ]
+
+    def draw_menu(self):
+        # Background for menu (slightly different shade)
+        self.screen.fill((30, 30, 60))
+
+        # Title, subtitle and hint
+        for surf, rect in self._menu_text:
+            self.screen.blit(surf, rect)
+
+        # Draw main Play and Quit buttons
+        for key in ('play', 'quit'):
+            pygame.draw.rect(self.screen, BORDER_COLOR, self.menu_buttons[key])
+            self.screen.blit(*self._menu_labels[key])
 
         # Draw level buttons, highlight selected
-        for idx, r in enumerate((lvl1_rect, lvl2_rect, lvl3_rect), start=1):
+        for idx, key in enumerate(('lvl1', 'lvl2', 'lvl3'), start=1):
+            r = self.menu_buttons[key]
             fill = (30, 90, 30) if self.selected_level == idx else (0, 76, 0)
             pygame.draw.rect(self.screen, fill, r)
             pygame.draw.rect(self.screen, BORDER_COLOR, r, 2)
-            t = self.font.render(str(idx), True, TEXT_COLOR)
-            tr = t.get_rect(center=r.center)
-            self.screen.blit(t, tr)
-
-        # Draw Quit button
-        pygame.draw.rect(self.screen, BORDER_COLOR, quit_rect)
-        quit_text = self.font.render("QUIT", True, TEXT_COLOR)
-        quit_text_rect = quit_text.get_rect(center=quit_rect.center)
-        self.screen.blit(quit_text, quit_text_rect)
-
-        # Hint
-        hint = self.font.render("Press ENTER to start | 1-3 to choose level", True, TEXT_COLOR)
-        hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-        self.screen.blit(hint, hint_rect)
+            self.screen.blit(*self._menu_labels[key])
     
     def run(self):
         running = True
@@ -405,7 +575,11 @@ class SnakeGame:
             
             if running:
                 self.update()
-                self.draw()
+                # A paused or finished game is frozen; repaint only when a
+                # toggle or reset asked for it
+                frozen = not self.menu_active and (self.game_paused or self.game_over)
+                if not frozen or self._full_redraw:
+                    self.draw()
         
         pygame.quit()
         sys.exit()